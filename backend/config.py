@@ -11,6 +11,12 @@ MODEL_NAME = os.getenv("MODEL_NAME")
 CHROMA_DB_PATH = os.getenv("CHROMA_DB_PATH")
 UPLOAD_DIR = os.getenv("UPLOAD_DIR")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL")
+TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", "4"))
+DEFAULT_COLLECTION = os.getenv("DEFAULT_COLLECTION", "documents")
+CHROMA_MEMORY_LIMIT_BYTES = int(os.getenv("CHROMA_MEMORY_LIMIT_BYTES", "0"))
+
+# ChromaDB collection names: 3-63 chars, alphanumeric at both ends
+COLLECTION_NAME_PATTERN = r"^[a-zA-Z0-9][a-zA-Z0-9._-]{1,61}[a-zA-Z0-9]$"
 
 SUPPORTED_LANGUAGES = [
     "Arabic", "Chinese (Simplified)", "Czech", "Dutch", "English",
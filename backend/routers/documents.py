@@ -1,18 +1,22 @@
 import shutil
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Query, HTTPException
 
-from backend.config import UPLOAD_DIR
-from backend.schemas import DocumentInfo
+from backend.config import UPLOAD_DIR, DEFAULT_COLLECTION, COLLECTION_NAME_PATTERN
+from backend.schemas import DocumentInfo, CollectionList
 from backend.services import document_service, rag_service
 
 router = APIRouter(prefix="/api/documents")
 
 
 @router.post("/upload", response_model=DocumentInfo)
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(
+    file: UploadFile = File(...),
+    collection: str = Form(DEFAULT_COLLECTION, pattern=COLLECTION_NAME_PATTERN),
+    language: Optional[str] = Form(None),
+):
     if not file.filename:
         raise HTTPException(400, "No filename provided")
 
@@ -33,20 +37,34 @@ async def upload_document(file: UploadFile = File(...)):
     if not chunks:
         raise HTTPException(400, "No text could be extracted from the document.")
 
-    doc_id = rag_service.add_documents(chunks, file.filename)
+    doc_id = rag_service.add_documents(chunks, file.filename, collection=collection, language=language)
 
-    return DocumentInfo(id=doc_id, filename=file.filename, chunk_count=len(chunks))
+    return DocumentInfo(
+        id=doc_id,
+        filename=file.filename,
+        chunk_count=len(chunks),
+        collection=collection,
+        language=language,
+    )
 
 
 @router.get("", response_model=List[DocumentInfo])
-async def list_documents():
-    docs = rag_service.list_documents()
+async def list_documents(collection: str = Query(DEFAULT_COLLECTION, pattern=COLLECTION_NAME_PATTERN)):
+    docs = rag_service.list_documents(collection)
     return [DocumentInfo(**d) for d in docs]
 
 
+@router.get("/collections", response_model=CollectionList)
+async def list_collections():
+    return CollectionList(collections=rag_service.list_collections())
+
+
 @router.delete("/{doc_id}")
-async def delete_document(doc_id: str):
-    deleted = rag_service.delete_document(doc_id)
+async def delete_document(
+    doc_id: str,
+    collection: str = Query(DEFAULT_COLLECTION, pattern=COLLECTION_NAME_PATTERN),
+):
+    deleted = rag_service.delete_document(doc_id, collection)
     if not deleted:
         raise HTTPException(404, "Document not found")
     return {"status": "deleted"}
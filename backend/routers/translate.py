@@ -1,8 +1,10 @@
 from typing import List
 from pathlib import Path
 import shutil
+import uuid
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.responses import FileResponse
 
 from backend.schemas import TranslateRequest, TranslateResponse, DocumentTranslateResponse, AskRequest, AskResponse
 from backend.services import model_service, rag_service, document_service
@@ -16,7 +18,8 @@ async def translate(req: TranslateRequest):
     context_snippets: List[str] = []
 
     if req.use_rag:
-        context_snippets = rag_service.query_similar(req.text)
+        filters = req.filters.model_dump() if req.filters else {}
+        context_snippets = rag_service.query_similar(req.text, collection=req.collection, **filters)
 
     context = "\n---\n".join(context_snippets) if context_snippets else None
 
@@ -39,6 +42,7 @@ async def translate_document(
     file: UploadFile = File(...),
     source_language: str = Form(...),
     target_language: str = Form(...),
+    preserve_structure: bool = Form(False),
 ):
     if not file.filename:
         raise HTTPException(400, "No filename provided")
@@ -54,20 +58,17 @@ async def translate_document(
     with open(dest, "wb") as f:
         shutil.copyfileobj(file.file, f)
 
+    if preserve_structure and suffix == ".docx":
+        return _translate_docx(dest, source_language, target_language)
+    if preserve_structure and suffix == ".pdf":
+        return _translate_pdf(dest, source_language, target_language)
+
     text = document_service.extract_text(str(dest))
     if not text.strip():
         raise HTTPException(400, "No text could be extracted from the document.")
 
-    chunks = document_service.chunk_text(text, chunk_size=3000, overlap=0)
-
-    translated_chunks: List[str] = []
-    for chunk in chunks:
-        translated = model_service.translate(
-            text=chunk,
-            source_language=source_language,
-            target_language=target_language,
-        )
-        translated_chunks.append(translated)
+    chunks = document_service.chunk_paragraphs(text, chunk_size=3000)
+    translated_chunks = model_service.translate_segments(chunks, source_language, target_language)
 
     return DocumentTranslateResponse(
         translated_chunks=translated_chunks,
@@ -77,10 +78,72 @@ async def translate_document(
     )
 
 
+@router.get("/translate-document/{filename}")
+async def download_translated_document(filename: str):
+    path = _translated_dir() / Path(filename).name
+    if not path.is_file():
+        raise HTTPException(404, "Translated document not found")
+    return FileResponse(path, filename=path.name)
+
+
+def _translated_dir() -> Path:
+    path = Path(UPLOAD_DIR) / "translated"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _translate_docx(path: Path, source_language: str, target_language: str) -> DocumentTranslateResponse:
+    doc = document_service.load_docx(str(path))
+    paragraphs = document_service.collect_docx_paragraphs(doc)
+    if not paragraphs:
+        raise HTTPException(400, "No text could be extracted from the document.")
+
+    texts = [document_service.paragraph_text(p) for p in paragraphs]
+    translated = model_service.translate_segments(texts, source_language, target_language)
+    for paragraph, text in zip(paragraphs, translated):
+        document_service.replace_paragraph_text(paragraph, text)
+
+    output_name = f"translated_{uuid.uuid4().hex}_{path.name}"
+    doc.save(_translated_dir() / output_name)
+
+    return DocumentTranslateResponse(
+        translated_chunks=translated,
+        full_translation="\n".join(translated),
+        source_language=source_language,
+        target_language=target_language,
+        output_file=output_name,
+    )
+
+
+def _translate_pdf(path: Path, source_language: str, target_language: str) -> DocumentTranslateResponse:
+    pages = document_service.extract_pdf_pages(str(path))
+    if not any(page.strip() for page in pages):
+        raise HTTPException(400, "No text could be extracted from the document.")
+
+    page_chunks = [document_service.chunk_paragraphs(page, chunk_size=3000) for page in pages]
+    flat = [chunk for chunks in page_chunks for chunk in chunks]
+    translated = iter(model_service.translate_segments(flat, source_language, target_language))
+    translated_pages = ["\n\n".join(next(translated) for _ in chunks) for chunks in page_chunks]
+
+    output_name = f"translated_{uuid.uuid4().hex}_{path.stem}.txt"
+    (_translated_dir() / output_name).write_text("\f".join(translated_pages), encoding="utf-8")
+
+    return DocumentTranslateResponse(
+        translated_chunks=translated_pages,
+        full_translation="\n\n".join(translated_pages),
+        source_language=source_language,
+        target_language=target_language,
+        output_file=output_name,
+    )
+
+
 @router.post("/ask", response_model=AskResponse)
 async def ask_question(req: AskRequest):
     if req.use_rag:
-        context_snippets = rag_service.query_similar(req.question, n_results=5)
+        filters = req.filters.model_dump() if req.filters else {}
+        context_snippets = rag_service.query_similar(
+            req.question, n_results=5, collection=req.collection, **filters
+        )
         context = "\n---\n".join(context_snippets) if context_snippets else ""
 
         answer = model_service.answer_question(
@@ -1,5 +1,13 @@
-from typing import List
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from backend.config import DEFAULT_COLLECTION, COLLECTION_NAME_PATTERN
+
+
+class RetrievalFilter(BaseModel):
+    doc_id: Optional[str] = None
+    filename: Optional[str] = None
+    language: Optional[str] = None
 
 
 class TranslateRequest(BaseModel):
@@ -7,6 +15,8 @@ class TranslateRequest(BaseModel):
     source_language: str
     target_language: str
     use_rag: bool = True
+    collection: str = Field(DEFAULT_COLLECTION, pattern=COLLECTION_NAME_PATTERN)
+    filters: Optional[RetrievalFilter] = None
 
 
 class TranslateResponse(BaseModel):
@@ -20,6 +30,7 @@ class DocumentTranslateResponse(BaseModel):
     full_translation: str
     source_language: str
     target_language: str
+    output_file: Optional[str] = None
 
 
 class AskRequest(BaseModel):
@@ -27,6 +38,8 @@ class AskRequest(BaseModel):
     source_language: str
     target_language: str
     use_rag: bool = True
+    collection: str = Field(DEFAULT_COLLECTION, pattern=COLLECTION_NAME_PATTERN)
+    filters: Optional[RetrievalFilter] = None
 
 
 class AskResponse(BaseModel):
@@ -39,3 +52,10 @@ class DocumentInfo(BaseModel):
     id: str
     filename: str
     chunk_count: int
+    collection: str = DEFAULT_COLLECTION
+    language: Optional[str] = None
+
+
+class CollectionList(BaseModel):
+    collections: List[str]
+    default: str = DEFAULT_COLLECTION
@@ -1,7 +1,11 @@
+import re
 from pathlib import Path
+from typing import List
 
 from pypdf import PdfReader
 from docx import Document
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 
 def extract_text(file_path: str) -> str:
@@ -9,8 +13,7 @@ def extract_text(file_path: str) -> str:
     suffix = path.suffix.lower()
 
     if suffix == ".pdf":
-        reader = PdfReader(path)
-        return "\n".join(page.extract_text() or "" for page in reader.pages)
+        return "\n".join(extract_pdf_pages(file_path))
     elif suffix == ".docx":
         doc = Document(path)
         return "\n".join(p.text for p in doc.paragraphs)
@@ -20,6 +23,11 @@ def extract_text(file_path: str) -> str:
         raise ValueError(f"Unsupported file type: {suffix}")
 
 
+def extract_pdf_pages(file_path: str) -> List[str]:
+    reader = PdfReader(Path(file_path))
+    return [page.extract_text() or "" for page in reader.pages]
+
+
 def chunk_text(text: str, chunk_size: int = 500, overlap: int = 100) -> list[str]:
     if not text.strip():
         return []
@@ -32,3 +40,105 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 100) -> list[str
             chunks.append(chunk.strip())
         start += chunk_size - overlap
     return chunks
+
+
+def _pack(pieces: list[str], separator: str, chunk_size: int) -> list[str]:
+    chunks: list[str] = []
+    current: list[str] = []
+    length = 0
+    for piece in pieces:
+        if current and length + len(separator) + len(piece) > chunk_size:
+            chunks.append(separator.join(current))
+            current, length = [], 0
+        length += len(piece) + (len(separator) if current else 0)
+        current.append(piece)
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def chunk_paragraphs(text: str, chunk_size: int = 3000) -> list[str]:
+    """Pack whole blank-line separated paragraphs into chunks of at most chunk_size chars.
+
+    Line breaks and indentation inside paragraphs are kept. A paragraph longer than
+    chunk_size is split on line boundaries, and a single overlong line by characters.
+    """
+    pieces: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.rstrip().strip("\n")
+        if not paragraph.strip():
+            continue
+        if len(paragraph) <= chunk_size:
+            pieces.append(paragraph)
+            continue
+        lines: list[str] = []
+        for line in paragraph.splitlines():
+            if len(line) > chunk_size:
+                lines.extend(chunk_text(line, chunk_size=chunk_size, overlap=0))
+            else:
+                lines.append(line)
+        pieces.extend(_pack(lines, "\n", chunk_size))
+    return _pack(pieces, "\n\n", chunk_size)
+
+
+def load_docx(file_path: str):
+    return Document(Path(file_path))
+
+
+def _iter_block_paragraphs(container):
+    yield from container.paragraphs
+    for table in container.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield from _iter_block_paragraphs(cell)
+
+
+def collect_docx_paragraphs(doc) -> List[Paragraph]:
+    """Return every text-bearing paragraph in the body, tables, headers and footers.
+
+    Merged table cells and linked headers share paragraphs, so each one is returned once.
+    """
+    containers = [doc]
+    for section in doc.sections:
+        for part in (
+            section.header, section.first_page_header, section.even_page_header,
+            section.footer, section.first_page_footer, section.even_page_footer,
+        ):
+            if not part.is_linked_to_previous:
+                containers.append(part)
+
+    seen = set()
+    paragraphs: List[Paragraph] = []
+    for container in containers:
+        for paragraph in _iter_block_paragraphs(container):
+            if paragraph._p in seen:
+                continue
+            seen.add(paragraph._p)
+            if paragraph_text(paragraph).strip():
+                paragraphs.append(paragraph)
+    return paragraphs
+
+
+def _paragraph_runs(paragraph: Paragraph) -> List[Run]:
+    """Runs in document order, including those nested in hyperlinks."""
+    runs: List[Run] = []
+    for item in paragraph.iter_inner_content():
+        if isinstance(item, Run):
+            runs.append(item)
+        else:
+            runs.extend(item.runs)
+    return runs
+
+
+def paragraph_text(paragraph: Paragraph) -> str:
+    return "".join(run.text for run in _paragraph_runs(paragraph))
+
+
+def replace_paragraph_text(paragraph: Paragraph, text: str) -> None:
+    """Write text into the first non-empty run and clear the rest, keeping that run's formatting."""
+    runs = [run for run in _paragraph_runs(paragraph) if run.text]
+    if not runs:
+        return
+    runs[0].text = text
+    for run in runs[1:]:
+        run.text = ""
@@ -1,10 +1,12 @@
 from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+import re
 import time
 import logging
 
 import ollama
 
-from backend.config import OLLAMA_BASE_URL, MODEL_NAME
+from backend.config import OLLAMA_BASE_URL, MODEL_NAME, TRANSLATION_WORKERS
 
 # Configure logging
 logging.basicConfig(
@@ -100,6 +102,108 @@ def translate(
         raise
 
 
+_SEGMENT_MARKER = re.compile(r"^\[\[(\d+)\]\][ \t]*", re.MULTILINE)
+
+
+def _chat(prompt: str) -> str:
+    logger.info(f"🚀 Sending request to Ollama at {OLLAMA_BASE_URL} ({len(prompt)} chars)...")
+    start_time = time.time()
+    try:
+        response = _client.chat(
+            model=MODEL_NAME,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        elapsed = time.time() - start_time
+        result = response["message"]["content"].strip()
+        logger.info(f"✅ Response received in {elapsed:.2f}s ({len(result)} chars)")
+        return result
+    except Exception as e:
+        elapsed = time.time() - start_time
+        logger.error(f"❌ Request failed after {elapsed:.2f}s")
+        logger.error(f"   Error: {str(e)}")
+        raise
+
+
+def _translate_only_prompt(source_language: str, target_language: str) -> str:
+    src_code = _get_code(source_language)
+    tgt_code = _get_code(target_language)
+    return (
+        f"You are a professional translator from {source_language} ({src_code}) "
+        f"to {target_language} ({tgt_code}). Translate the text faithfully. "
+        f"Never answer questions, explain, summarize or add content: a question is translated as a question. "
+        f"Preserve line breaks and output only the translation."
+    )
+
+
+def _translate_batch(batch: List[str], source_language: str, target_language: str) -> List[str]:
+    """Translate several segments in one call, numbering them so the reply can be split back."""
+    instructions = _translate_only_prompt(source_language, target_language)
+    if len(batch) == 1:
+        return [_chat(f"{instructions}\n\nText:\n{batch[0]}")]
+
+    numbered = "\n\n".join(f"[[{i}]] {text}" for i, text in enumerate(batch, 1))
+    prompt = (
+        f"{instructions}\n\n"
+        f"The text below consists of {len(batch)} segments, each starting with a marker like [[1]]. "
+        f"Translate every segment and keep each marker, in the same order, at the start of its translation.\n\n"
+        f"{numbered}"
+    )
+    reply = _chat(prompt)
+
+    parts = _SEGMENT_MARKER.split(reply)
+    translations = {int(num): text.strip() for num, text in zip(parts[1::2], parts[2::2])}
+    if sorted(translations) != list(range(1, len(batch) + 1)):
+        logger.warning(f"⚠️ Batch reply had {len(translations)}/{len(batch)} segments, translating one by one")
+        return [_chat(f"{instructions}\n\nText:\n{text}") for text in batch]
+    return [translations[i] for i in range(1, len(batch) + 1)]
+
+
+def _batch_segments(segments: List[str], max_chars: int) -> List[List[str]]:
+    batches: List[List[str]] = []
+    current: List[str] = []
+    length = 0
+    for segment in segments:
+        if current and length + len(segment) > max_chars:
+            batches.append(current)
+            current, length = [], 0
+        current.append(segment)
+        length += len(segment)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def translate_segments(
+    segments: List[str],
+    source_language: str,
+    target_language: str,
+    max_chars: int = 3000,
+    max_workers: int = TRANSLATION_WORKERS,
+) -> List[str]:
+    """Translate document segments with a translate-only prompt.
+
+    Distinct segments are packed into numbered batches of about max_chars, one model call
+    per batch, and batches run in parallel. Returns translations aligned with the input;
+    blank segments are passed through unchanged.
+    """
+    unique = list(dict.fromkeys(s.strip() for s in segments if s.strip()))
+    batches = _batch_segments(unique, max_chars)
+
+    logger.info(
+        f"🧩 Translating {len(segments)} segments ({len(unique)} unique) "
+        f"in {len(batches)} batches with {max_workers} workers"
+    )
+
+    def _translate(batch: List[str]) -> List[str]:
+        return _translate_batch(batch, source_language, target_language)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        translated = [text for batch in executor.map(_translate, batches) for text in batch]
+
+    translations = dict(zip(unique, translated))
+    return [translations[s.strip()] if s.strip() else s for s in segments]
+
+
 def answer_question(
     question: str,
     context: str,
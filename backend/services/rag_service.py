@@ -2,15 +2,14 @@ import uuid
 from typing import Optional, List, Dict
 
 import chromadb
+from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
-from backend.config import CHROMA_DB_PATH, EMBEDDING_MODEL
+from backend.config import CHROMA_DB_PATH, EMBEDDING_MODEL, DEFAULT_COLLECTION, CHROMA_MEMORY_LIMIT_BYTES
 
 _embedding_model: Optional[SentenceTransformer] = None
 _chroma_client: Optional[chromadb.PersistentClient] = None
 
-COLLECTION_NAME = "documents"
-
 
 def _get_embedding_model() -> SentenceTransformer:
     global _embedding_model
@@ -19,63 +18,123 @@ def _get_embedding_model() -> SentenceTransformer:
     return _embedding_model
 
 
-def _get_collection() -> chromadb.Collection:
+def _get_client() -> chromadb.PersistentClient:
+    """Collection indexes load on first use; with a memory limit, cold ones are evicted LRU."""
     global _chroma_client
     if _chroma_client is None:
-        _chroma_client = chromadb.PersistentClient(path=CHROMA_DB_PATH)
-    return _chroma_client.get_or_create_collection(
-        name=COLLECTION_NAME,
+        settings = Settings(
+            chroma_segment_cache_policy="LRU",
+            chroma_memory_limit_bytes=CHROMA_MEMORY_LIMIT_BYTES,
+        ) if CHROMA_MEMORY_LIMIT_BYTES > 0 else Settings()
+        _chroma_client = chromadb.PersistentClient(path=CHROMA_DB_PATH, settings=settings)
+    return _chroma_client
+
+
+def _get_collection(name: str = DEFAULT_COLLECTION, create: bool = True) -> Optional[chromadb.Collection]:
+    client = _get_client()
+    if not create:
+        try:
+            return client.get_collection(name=name)
+        except ValueError:
+            return None
+    return client.get_or_create_collection(
+        name=name,
         metadata={"hnsw:space": "cosine"},
     )
 
 
+def _build_where(
+    doc_id: Optional[str] = None,
+    filename: Optional[str] = None,
+    language: Optional[str] = None,
+) -> Optional[Dict]:
+    conditions = [
+        {key: value}
+        for key, value in (("doc_id", doc_id), ("filename", filename), ("language", language))
+        if value
+    ]
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
 def _embed(texts: List[str]) -> List[List[float]]:
     model = _get_embedding_model()
     return model.encode(texts, show_progress_bar=False).tolist()
 
 
-def add_documents(chunks: List[str], filename: str) -> str:
+def list_collections() -> List[str]:
+    return sorted(c.name for c in _get_client().list_collections())
+
+
+def add_documents(
+    chunks: List[str],
+    filename: str,
+    collection: str = DEFAULT_COLLECTION,
+    language: Optional[str] = None,
+) -> str:
     """Store chunks in ChromaDB. Returns a document group id."""
-    collection = _get_collection()
+    coll = _get_collection(collection)
     doc_id = uuid.uuid4().hex[:12]
     ids = [f"{doc_id}_{i}" for i in range(len(chunks))]
     embeddings = _embed(chunks)
-    metadatas = [{"filename": filename, "doc_id": doc_id, "chunk_index": i} for i in range(len(chunks))]
-    collection.add(ids=ids, embeddings=embeddings, documents=chunks, metadatas=metadatas)
+    base_meta = {"filename": filename, "doc_id": doc_id}
+    if language:
+        base_meta["language"] = language
+    metadatas = [{**base_meta, "chunk_index": i} for i in range(len(chunks))]
+    coll.add(ids=ids, embeddings=embeddings, documents=chunks, metadatas=metadatas)
     return doc_id
 
 
-def query_similar(text: str, n_results: int = 3) -> List[str]:
-    collection = _get_collection()
-    if collection.count() == 0:
+def query_similar(
+    text: str,
+    n_results: int = 3,
+    collection: str = DEFAULT_COLLECTION,
+    doc_id: Optional[str] = None,
+    filename: Optional[str] = None,
+    language: Optional[str] = None,
+) -> List[str]:
+    """Search one collection, restricting the ANN search to chunks matching the given metadata."""
+    coll = _get_collection(collection, create=False)
+    if coll is None or coll.count() == 0:
         return []
     embeddings = _embed([text])
-    results = collection.query(query_embeddings=embeddings, n_results=min(n_results, collection.count()))
+    results = coll.query(
+        query_embeddings=embeddings,
+        n_results=min(n_results, coll.count()),
+        where=_build_where(doc_id=doc_id, filename=filename, language=language),
+    )
     return results["documents"][0] if results["documents"] else []
 
 
-def list_documents() -> List[Dict]:
-    collection = _get_collection()
-    if collection.count() == 0:
+def list_documents(collection: str = DEFAULT_COLLECTION) -> List[Dict]:
+    coll = _get_collection(collection, create=False)
+    if coll is None or coll.count() == 0:
         return []
-    all_data = collection.get(include=["metadatas"])
+    all_data = coll.get(include=["metadatas"])
     docs: Dict[str, Dict] = {}
     for meta in all_data["metadatas"]:
         did = meta["doc_id"]
         if did not in docs:
-            docs[did] = {"id": did, "filename": meta["filename"], "chunk_count": 0}
+            docs[did] = {
+                "id": did,
+                "filename": meta["filename"],
+                "chunk_count": 0,
+                "collection": collection,
+                "language": meta.get("language"),
+            }
         docs[did]["chunk_count"] += 1
     return list(docs.values())
 
 
-def delete_document(doc_id: str) -> bool:
-    collection = _get_collection()
-    all_data = collection.get(include=["metadatas"])
-    ids_to_delete = [
-        id_ for id_, meta in zip(all_data["ids"], all_data["metadatas"])
-        if meta.get("doc_id") == doc_id
-    ]
-    if not ids_to_delete:
+def delete_document(doc_id: str, collection: str = DEFAULT_COLLECTION) -> bool:
+    coll = _get_collection(collection, create=False)
+    if coll is None:
+        return False
+    where = _build_where(doc_id=doc_id)
+    if not coll.get(where=where, include=[])["ids"]:
         return False
-    collection.delete(ids=ids_to_delete)
+    coll.delete(where=where)
     return True
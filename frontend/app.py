@@ -1,6 +1,8 @@
 import streamlit as st
 import httpx
 import os
+import re
+from urllib.parse import quote
 
 # Read backend URL from environment variable (for Docker)
 # Defaults to localhost for local development
@@ -22,6 +24,37 @@ def get_languages():
 
 languages = get_languages()
 
+# Mirrors backend COLLECTION_NAME_PATTERN
+COLLECTION_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]{1,61}[a-zA-Z0-9]$")
+NEW_COLLECTION = "+ New collection..."
+
+
+@st.cache_data(ttl=30)
+def get_collections():
+    try:
+        r = httpx.get(f"{API_BASE}/documents/collections", timeout=5)
+        r.raise_for_status()
+        return r.json()
+    except Exception:
+        return {"collections": [], "default": "documents"}
+
+
+collections_info = get_collections()
+collection_options = list(dict.fromkeys([collections_info["default"], *collections_info["collections"]]))
+selected_collection = st.sidebar.selectbox(
+    "Document collection", collection_options + [NEW_COLLECTION],
+    help="Documents are indexed and searched per collection (e.g. one per team or project).",
+)
+if selected_collection == NEW_COLLECTION:
+    collection = st.sidebar.text_input("New collection name", key="new_collection").strip()
+else:
+    collection = selected_collection
+
+collection_valid = bool(COLLECTION_NAME_PATTERN.match(collection))
+if collection and not collection_valid:
+    st.sidebar.error("Collection names must be 3-63 characters of letters, digits, '.', '_' or '-', "
+                     "starting and ending with a letter or digit.")
+
 tab_translate, tab_ask, tab_docs = st.tabs(["Translate Document", "Translate / Ask", "Manage Documents"])
 
 # --- Translate Document Tab ---
@@ -39,6 +72,8 @@ with tab_translate:
                                        key="doc_tgt")
 
     doc_file = st.file_uploader("Upload a document (PDF, TXT, DOCX)", type=["pdf", "txt", "docx"], key="doc_translate")
+    preserve_structure = st.checkbox("Preserve document structure (DOCX tables/headers/formatting, PDF pages)",
+                                     key="doc_preserve")
 
     if doc_file and st.button("Translate Document", type="primary"):
         with st.spinner("Translating document..."):
@@ -46,7 +81,11 @@ with tab_translate:
                 r = httpx.post(
                     f"{API_BASE}/translate-document",
                     files={"file": (doc_file.name, doc_file.getvalue(), doc_file.type)},
-                    data={"source_language": doc_source_lang, "target_language": doc_target_lang},
+                    data={
+                        "source_language": doc_source_lang,
+                        "target_language": doc_target_lang,
+                        "preserve_structure": preserve_structure,
+                    },
                     timeout=600,
                 )
                 r.raise_for_status()
@@ -58,6 +97,14 @@ with tab_translate:
                     file_name=f"translated_{doc_file.name.rsplit('.', 1)[0]}.txt",
                     mime="text/plain",
                 )
+                if data.get("output_file"):
+                    out = httpx.get(f"{API_BASE}/translate-document/{quote(data['output_file'])}", timeout=60)
+                    out.raise_for_status()
+                    st.download_button(
+                        "Download translated document",
+                        data=out.content,
+                        file_name=data["output_file"],
+                    )
             except httpx.HTTPStatusError as e:
                 st.error(f"API error: {e.response.text}")
             except Exception as e:
@@ -84,10 +131,10 @@ with tab_ask:
     else:
         question = st.text_area("Question about indexed documents", height=150, key="ask_input")
 
-    if st.button("Submit", type="primary", disabled=not question.strip()):
+    use_rag = mode == "Ask Question (RAG)"
+    if st.button("Submit", type="primary", disabled=not question.strip() or (use_rag and not collection_valid)):
         with st.spinner("Processing..."):
             try:
-                use_rag = mode == "Ask Question (RAG)"
                 r = httpx.post(
                     f"{API_BASE}/ask",
                     json={
@@ -95,6 +142,7 @@ with tab_ask:
                         "source_language": ask_source_lang,
                         "target_language": ask_target_lang,
                         "use_rag": use_rag,
+                        **({"collection": collection} if use_rag else {}),
                     },
                     timeout=600,
                 )
@@ -121,35 +169,40 @@ with tab_docs:
     st.caption("Upload documents here so the 'Ask Questions' tab can search them for answers.")
 
     uploaded = st.file_uploader("Upload a document (PDF, TXT, DOCX)", type=["pdf", "txt", "docx"], key="doc_index")
-    if uploaded and st.button("Index document"):
+    if uploaded and st.button("Index document", disabled=not collection_valid):
         with st.spinner("Uploading and indexing..."):
             try:
                 r = httpx.post(
                     f"{API_BASE}/documents/upload",
                     files={"file": (uploaded.name, uploaded.getvalue(), uploaded.type)},
+                    data={"collection": collection},
                     timeout=600,
                 )
                 r.raise_for_status()
                 info = r.json()
-                st.success(f"Indexed **{info['filename']}** ({info['chunk_count']} chunks)")
+                get_collections.clear()
+                st.success(f"Indexed **{info['filename']}** ({info['chunk_count']} chunks) in `{info['collection']}`")
             except httpx.HTTPStatusError as e:
                 st.error(f"Upload error: {e.response.text}")
             except Exception as e:
                 st.error(f"Connection error: {e}")
 
     st.subheader("Indexed Documents")
-    try:
-        r = httpx.get(f"{API_BASE}/documents", timeout=5)
-        r.raise_for_status()
-        docs = r.json()
-        if not docs:
-            st.info("No documents indexed yet.")
-        for doc in docs:
-            col_name, col_chunks, col_del = st.columns([3, 1, 1])
-            col_name.write(doc["filename"])
-            col_chunks.write(f"{doc['chunk_count']} chunks")
-            if col_del.button("Delete", key=doc["id"]):
-                httpx.delete(f"{API_BASE}/documents/{doc['id']}", timeout=10)
-                st.rerun()
-    except Exception:
-        st.warning("Could not connect to backend. Is the API running?")
+    if not collection_valid:
+        st.info("Choose a valid collection in the sidebar to see its documents.")
+    else:
+        try:
+            r = httpx.get(f"{API_BASE}/documents", params={"collection": collection}, timeout=5)
+            r.raise_for_status()
+            docs = r.json()
+            if not docs:
+                st.info("No documents indexed yet.")
+            for doc in docs:
+                col_name, col_chunks, col_del = st.columns([3, 1, 1])
+                col_name.write(doc["filename"])
+                col_chunks.write(f"{doc['chunk_count']} chunks")
+                if col_del.button("Delete", key=doc["id"]):
+                    httpx.delete(f"{API_BASE}/documents/{doc['id']}", params={"collection": collection}, timeout=10)
+                    st.rerun()
+        except Exception:
+            st.warning("Could not connect to backend. Is the API running?")